@@ -1,13 +1,10 @@
 #!/usr/bin/env python3
-import difflib
-import json
+# difflib, json, subprocess, cookiecutter and scenario_init are imported
+# inside the functions that need them to keep `--help`/`--version` fast.
 import os
-import subprocess
 import sys
 from typing import List, Optional
-from cookiecutter.main import cookiecutter
 from killercoda_cli.__about__ import __version__
-from killercoda_cli.scenario_init import init_project
 
 class FileOperation:
     """
@@ -20,6 +17,10 @@ class FileOperation:
 
     """
 
+    # A slotted class rather than a dataclass: importing dataclasses pulls in
+    # inspect/ast/dis and would dominate the CLI's import time.
+    __slots__ = ("operation", "path", "content", "mode")
+
     def __init__(
         self,
         operation: str,
@@ -27,22 +28,32 @@ class FileOperation:
         content: Optional[str] = None,
         mode: Optional[int] = None,
     ):
-        self.operation = operation
-        self.path = path
-        self.content = content
-        self.mode = mode
+        object.__setattr__(self, "operation", operation)
+        object.__setattr__(self, "path", path)
+        object.__setattr__(self, "content", content)
+        object.__setattr__(self, "mode", mode)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"FileOperation is immutable, cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"FileOperation is immutable, cannot delete {name!r}")
+
+    def __reduce__(self):
+        # Rebuild through __init__ so copy and pickle don't go through __setattr__
+        return (FileOperation, self._key())
+
+    def _key(self):
+        return (self.operation, self.path, self.content, self.mode)
 
     def __eq__(self, other):
         if not isinstance(other, FileOperation):
             # don't attempt to compare against unrelated types
             return NotImplemented
+        return self._key() == other._key()
 
-        return (
-            self.operation == other.operation
-            and self.path == other.path
-            and self.content == other.content
-            and self.mode == other.mode
-        )
+    def __hash__(self):
+        return hash(self._key())
 
     def __repr__(self):
         return (f"FileOperation(operation={self.operation}, path={self.path}, "
@@ -57,6 +68,8 @@ def get_tree_structure():
     Returns:
         A string representation of the directory structure.
     """
+    import subprocess
+
     # Get the current tree structure as a string
     result = subprocess.run(["tree"], stdout=subprocess.PIPE)
     return result.stdout.decode("utf-8")
@@ -73,6 +86,8 @@ def generate_diff(old_tree, new_tree):
     Returns:
         str: A string containing the unified diff.
     """
+    import difflib
+
     # Use difflib to print a diff of the two tree outputs
     diff = difflib.unified_diff(
         old_tree.splitlines(keepends=True),
@@ -83,19 +98,22 @@ def generate_diff(old_tree, new_tree):
     return "".join(diff)
 
 
-def get_current_steps_dict(directory_items):
+def get_current_steps_dict(directory_items, is_dir=None):
     """
     Build a dictionary mapping step numbers to their respective paths.
 
     Args:
         directory_items (list): A list of items (files and directories) in the current directory.
+        is_dir (callable, optional): Predicate telling whether an item is a directory, defaults to os.path.isdir.
 
     Returns:
         dict: A dictionary where keys are step numbers and values are the corresponding step paths.
     """
+    if is_dir is None:
+        is_dir = os.path.isdir
     steps_dict = {}
     for item in directory_items:
-        if item.startswith("step") and (os.path.isdir(item) or item.endswith(".md")):
+        if item.startswith("step") and (is_dir(item) or item.endswith(".md")):
             # Extract the step number from the name
             try:
                 step_num = int(item.replace("step", "").replace(".md", ""))
@@ -372,6 +390,8 @@ def execute_file_operations(file_operations):
             os.rename(operation.path, operation.content)
 
 def generate_assets():
+    from cookiecutter.main import cookiecutter
+
     try:
         template_repo = 'https://github.com/Piotr1215/cookiecutter-killercoda-assets'
         output_dir = os.getcwd()
@@ -404,20 +424,25 @@ def main():
             print(f"killercoda-cli v{__version__}")
             return
         if len(sys.argv) > 1 and sys.argv[1] in ["init"]:
+            from killercoda_cli.scenario_init import init_project
+
             init_project()
             return
         if len(sys.argv) > 1 and sys.argv[1] in ["assets"]:
             generate_assets()
             return
         
-        old_tree_structure = get_tree_structure()
+        import json
+
+        # Bail out on a missing index.json before spawning 'tree' or scanning steps
         directory_items = os.listdir(".")
-        steps_dict = get_current_steps_dict(directory_items)
         if "index.json" not in directory_items:
             print(
                 "The 'index.json' file is missing. Please ensure it is present in the current directory."
             )
             return
+        old_tree_structure = get_tree_structure()
+        steps_dict = get_current_steps_dict(directory_items)
         step_title_input = input("Enter the title for the new step: ")
         highest_step_num = max(steps_dict.keys(), default=0)
         step_number_input = input(
@@ -443,8 +468,7 @@ def main():
             json.dump(updated_index_data, index_file, ensure_ascii=False, indent=4)
         new_tree_structure = get_tree_structure()
         tree_diff = generate_diff(old_tree_structure, new_tree_structure)
-        print("\nFile structure changes:")
-        print(tree_diff, end="")
+        print(f"\nFile structure changes:\n{tree_diff}", end="")
     except Exception as e:
         import traceback
         print(f"An error occurred: {e}")
@@ -1,4 +1,12 @@
 #!/usr/bin/env python3
+import contextlib
+import copy
+import io
+import os
+import pickle
+import subprocess
+import sys
+import types
 import unittest
 from unittest import TestCase, mock
 from unittest.mock import patch, MagicMock
@@ -6,7 +14,73 @@ from killercoda_cli.cli import FileOperation
 from killercoda_cli import cli
 
 
+_EXPECTED_RENAME = (
+    FileOperation("makedirs", "step3"),
+    FileOperation("rename", "step2/background.sh", "step3/background.sh"),
+    FileOperation("rename", "step2/foreground.sh", "step3/foreground.sh"),
+    FileOperation("rename", "step2/step2.md", "step3/step3.md"),
+    FileOperation("makedirs", "step2"),
+    FileOperation("rename", "step1/background.sh", "step2/background.sh"),
+    FileOperation("rename", "step1/foreground.sh", "step2/foreground.sh"),
+    FileOperation("rename", "step1/step1.md", "step2/step2.md"),
+)
+_EXPECTED_RENAME_WITH_VERIFY = (
+    FileOperation("makedirs", "step3"),
+    FileOperation("rename", "step2/background.sh", "step3/background.sh"),
+    FileOperation("rename", "step2/foreground.sh", "step3/foreground.sh"),
+    FileOperation("rename", "step2/verify.sh", "step3/verify.sh"),
+    FileOperation("rename", "step2/step2.md", "step3/step3.md"),
+    FileOperation("makedirs", "step2"),
+    FileOperation("rename", "step1/background.sh", "step2/background.sh"),
+    FileOperation("rename", "step1/foreground.sh", "step2/foreground.sh"),
+    FileOperation("rename", "step1/verify.sh", "step2/verify.sh"),
+    FileOperation("rename", "step1/step1.md", "step2/step2.md"),
+)
+_FILES_NO_VERIFY = frozenset({
+    "step2/background.sh", "step2/foreground.sh", "step2/step2.md",
+    "step1/background.sh", "step1/foreground.sh", "step1/step1.md",
+})
+_FILES_WITH_VERIFY = _FILES_NO_VERIFY | {"step2/verify.sh", "step1/verify.sh"}
+
+_EXPECTED_NEW_STEP = (
+    FileOperation("makedirs", "step4"),
+    FileOperation("write_file", "step4/step4.md", content="# New Step\n"),
+    FileOperation(
+        "write_file",
+        "step4/background.sh",
+        content='#!/bin/sh\necho "New Step script"\n',
+    ),
+    FileOperation(
+        "write_file",
+        "step4/foreground.sh",
+        content='#!/bin/sh\necho "New Step script"\n',
+    ),
+    FileOperation("chmod", "step4/background.sh", mode=0o755),
+    FileOperation("chmod", "step4/foreground.sh", mode=0o755),
+)
+
+# Modules that only individual subcommands need; importing the CLI must not load them
+_HEAVY_IMPORTS = frozenset({"cookiecutter", "difflib", "inquirer", "json", "subprocess"})
+
+
 class TestCLI(unittest.TestCase):
+    _BASE_INDEX_DATA = {
+        "details": {
+            "steps": [
+                {
+                    "title": "Step 1",
+                    "text": "step1/step1.md",
+                    "background": "step1/background.sh",
+                },
+                {
+                    "title": "Step 2",
+                    "text": "step2/step2.md",
+                    "background": "step2/background.sh",
+                },
+            ]
+        }
+    }
+
     def test_get_tree_structure(self):
         # Mock the subprocess.run to return a predefined tree output
         mock_output = """.
@@ -17,24 +91,31 @@ class TestCLI(unittest.TestCase):
             ├── background.sh
             └── step2.md
         """
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value.stdout = mock_output.encode("utf-8")
-            tree_structure = cli.get_tree_structure()
-            expected_output = mock_output
-            assert (
-                tree_structure == expected_output
-            ), "The tree structure output was not as expected."
+        completed = types.SimpleNamespace(stdout=mock_output.encode("utf-8"), returncode=0)
+        self.addCleanup(setattr, subprocess, "run", subprocess.run)
+        subprocess.run = lambda *args, **kwargs: completed
+        tree_structure = cli.get_tree_structure()
+        expected_output = mock_output
+        assert (
+            tree_structure == expected_output
+        ), "The tree structure output was not as expected."
 
     def test_generate_diff(self):
-        old_tree = "old\nstructure\n"
-        new_tree = "new\nstructure\n"
-        expected_diff = "Expected diff output"
-        with patch("difflib.unified_diff", return_value=expected_diff) as mock_diff:
-            diff = cli.generate_diff(old_tree, new_tree)
-            mock_diff.assert_called_once()
-            assert (
-                diff == expected_diff
-            ), "The generated diff output was not as expected."
+        old_tree = "step1\nold\nstructure\n"
+        new_tree = "step1\nnew\nstructure\n"
+        expected_diff = (
+            "--- Before changes\n"
+            "+++ After changes\n"
+            "@@ -1,3 +1,3 @@\n"
+            " step1\n"
+            "-old\n"
+            "+new\n"
+            " structure\n"
+        )
+        diff = cli.generate_diff(old_tree, new_tree)
+        assert (
+            diff == expected_diff
+        ), "The generated diff output was not as expected."
 
     def test_get_current_steps_dict(self):
         directory_items = ["step1", "step2", "step3.md", "not_a_step", "stepX"]
@@ -51,6 +132,12 @@ class TestCLI(unittest.TestCase):
         result = cli.get_current_steps_dict(directory_items)
         self.assertEqual(result, expected)
 
+    def test_get_current_steps_dict_with_is_dir(self):
+        directory_items = ["step1", "step2", "step3.md", "step4"]
+        expected = {1: "step1", 3: "step3.md"}
+        result = cli.get_current_steps_dict(directory_items, is_dir=lambda path: path == "step1")
+        self.assertEqual(result, expected)
+
     def test_get_user_input(self):
         steps_dict = {1: "step1", 2: "step2", 3: "step3.md"}
         step_title_input = "New Step Title"
@@ -72,81 +159,29 @@ class TestCLI(unittest.TestCase):
 
     def test_calculate_renaming_operations_with_verify(self):
         renaming_plan = [("step2", "step3"), ("step1", "step2")]
-        expected_operations = [
-            FileOperation("makedirs", "step3"),
-            FileOperation("rename", "step2/background.sh", "step3/background.sh"),
-            FileOperation("rename", "step2/foreground.sh", "step3/foreground.sh"),
-            FileOperation("rename", "step2/verify.sh", "step3/verify.sh"),
-            FileOperation("rename", "step2/step2.md", "step3/step3.md"),
-            FileOperation("makedirs", "step2"),
-            FileOperation("rename", "step1/background.sh", "step2/background.sh"),
-            FileOperation("rename", "step1/foreground.sh", "step2/foreground.sh"),
-            FileOperation("rename", "step1/verify.sh", "step2/verify.sh"),
-            FileOperation("rename", "step1/step1.md", "step2/step2.md"),
-        ]
         
         # Mock os.path.isdir and os.path.isfile
         with patch("os.path.isdir", return_value=True), patch("os.path.isfile") as mock_isfile:
             # Mock os.path.isfile to return True for specific files
-            def isfile_side_effect(path):
-                if path in [
-                    "step2/background.sh", "step2/foreground.sh", "step2/step2.md", "step2/verify.sh",
-                    "step1/background.sh", "step1/foreground.sh", "step1/step1.md", "step1/verify.sh"
-                ]:
-                    return True
-                return False
-            mock_isfile.side_effect = isfile_side_effect
+            mock_isfile.side_effect = _FILES_WITH_VERIFY.__contains__
 
             operations = cli.calculate_renaming_operations(renaming_plan)
-            assert operations == expected_operations, "The calculated file operations did not match the expected output."
+            assert operations == list(_EXPECTED_RENAME_WITH_VERIFY), "The calculated file operations did not match the expected output."
     def test_calculate_renaming_operations(self):
         renaming_plan = [("step2", "step3"), ("step1", "step2")]
-        expected_operations = [
-            FileOperation("makedirs", "step3"),
-            FileOperation("rename", "step2/background.sh", "step3/background.sh"),
-            FileOperation("rename", "step2/foreground.sh", "step3/foreground.sh"),
-            FileOperation("rename", "step2/step2.md", "step3/step3.md"),
-            FileOperation("makedirs", "step2"),
-            FileOperation("rename", "step1/background.sh", "step2/background.sh"),
-            FileOperation("rename", "step1/foreground.sh", "step2/foreground.sh"),
-            FileOperation("rename", "step1/step1.md", "step2/step2.md"),
-        ]
         
         # Mock os.path.isdir and os.path.isfile
         with patch("os.path.isdir", return_value=True), patch("os.path.isfile") as mock_isfile:
             # Mock os.path.isfile to return True for specific files
-            def isfile_side_effect(path):
-                if path in [
-                    "step2/background.sh", "step2/foreground.sh", "step2/step2.md",
-                    "step1/background.sh", "step1/foreground.sh", "step1/step1.md"
-                ]:
-                    return True
-                return False
-            mock_isfile.side_effect = isfile_side_effect
+            mock_isfile.side_effect = _FILES_NO_VERIFY.__contains__
 
             operations = cli.calculate_renaming_operations(renaming_plan)
-            assert operations == expected_operations, "The calculated file operations did not match the expected output."
+            assert operations == list(_EXPECTED_RENAME), "The calculated file operations did not match the expected output."
 
     def test_calculate_new_step_file_operations(self):
         insert_step_num = 4
         step_title = "New Step"
         step_type = "r"  # Assuming "r" is a valid step type. Adjust as necessary.
-        expected_operations = [
-            FileOperation("makedirs", "step4"),
-            FileOperation("write_file", "step4/step4.md", content="# New Step\n"),
-            FileOperation(
-                "write_file",
-                "step4/background.sh",
-                content='#!/bin/sh\necho "New Step script"\n',
-            ),
-            FileOperation(
-                "write_file",
-                "step4/foreground.sh",
-                content='#!/bin/sh\necho "New Step script"\n',
-            ),
-            FileOperation("chmod", "step4/background.sh", mode=0o755),
-            FileOperation("chmod", "step4/foreground.sh", mode=0o755),
-        ]
         operations = cli.calculate_new_step_file_operations(insert_step_num, step_title, step_type)
         #  # printe the operations
         #  for op in operations:
@@ -156,29 +191,15 @@ class TestCLI(unittest.TestCase):
         #  print(op.operation, op.path, content, mode)
 
         assert (
-            operations == expected_operations
+            operations == list(_EXPECTED_NEW_STEP)
         ), "The new step file operations did not match the expected output."
 
     def test_calculate_index_json_updates_for_verify(self):
         insert_step_num = 2
         step_title = "New Step"
         step_type = "v"
-        current_index_data = {
-            "details": {
-                "steps": [
-                    {
-                        "title": "Step 1",
-                        "text": "step1/step1.md",
-                        "background": "step1/background.sh",
-                    },
-                    {
-                        "title": "Step 2",
-                        "text": "step2/step2.md",
-                        "background": "step2/background.sh",
-                    },
-                ]
-            }
-        }
+        # calculate_index_json_updates mutates its input, so work on a copy
+        current_index_data = copy.deepcopy(self._BASE_INDEX_DATA)
         expected_data = {
             "details": {
                 "steps": [
@@ -211,22 +232,8 @@ class TestCLI(unittest.TestCase):
         insert_step_num = 2
         step_title = "New Step"
         step_type = "regular"
-        current_index_data = {
-            "details": {
-                "steps": [
-                    {
-                        "title": "Step 1",
-                        "text": "step1/step1.md",
-                        "background": "step1/background.sh",
-                    },
-                    {
-                        "title": "Step 2",
-                        "text": "step2/step2.md",
-                        "background": "step2/background.sh",
-                    },
-                ]
-            }
-        }
+        # calculate_index_json_updates mutates its input, so work on a copy
+        current_index_data = copy.deepcopy(self._BASE_INDEX_DATA)
         expected_data = {
             "details": {
                 "steps": [
@@ -255,30 +262,43 @@ class TestCLI(unittest.TestCase):
             updated_data == expected_data
         ), "The updated index.json data did not match the expected output."
 
+    def test_file_operation_copy_and_pickle(self):
+        op = FileOperation("chmod", "step1/background.sh", mode=0o755)
+        self.assertEqual(copy.copy(op), op)
+        self.assertEqual(copy.deepcopy(op), op)
+        self.assertEqual(pickle.loads(pickle.dumps(op)), op)
+        with self.assertRaises(AttributeError):
+            del op.path
+
+    @mock.patch("sys.argv", ["killercoda-cli", "--version"])
+    def test_version_flag(self):
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            cli.main()
+        self.assertEqual(buf.getvalue(), f"killercoda-cli v{cli.__version__}\n")
+
+    def test_cli_import_is_lightweight(self):
+        # Only report modules loaded by the import itself, not by interpreter startup hooks
+        probe = (
+            "import sys\n"
+            "before = set(sys.modules)\n"
+            "import killercoda_cli.cli\n"
+            "print('\\n'.join(sorted(set(sys.modules) - before)))\n"
+        )
+        repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        result = subprocess.run(
+            [sys.executable, "-c", probe],
+            capture_output=True,
+            text=True,
+            cwd=repo_root,
+            check=True,
+        )
+        imported = {name.split(".")[0] for name in result.stdout.split()}
+        self.assertFalse(
+            _HEAVY_IMPORTS & imported,
+            "Importing killercoda_cli.cli eagerly loaded subcommand-only modules.",
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
-    @mock.patch("builtins.open", new_callable=mock.mock_open)
-    @mock.patch("json.dump")
-    @mock.patch("os.path.exists", return_value=False)
-    def test_init_project(self, mock_exists, mock_json_dump, mock_open):
-        cli.init_project()
-        mock_open.assert_called_once_with("index.json", "w")
-        mock_json_dump.assert_called_once()
-        expected_index_data = {
-            "details": {
-                "title": "Project Title",
-                "description": "Project Description",
-                "steps": [],
-            }
-        }
-        args, kwargs = mock_json_dump.call_args
-        self.assertEqual(args[0], expected_index_data, "The index.json data does not match the expected structure.")
-        self.assertTrue("ensure_ascii" in kwargs and not kwargs["ensure_ascii"], "ensure_ascii should be False.")
-        self.assertTrue("indent" in kwargs and kwargs["indent"] == 4, "Indentation should be set to 4.")
-
-    @mock.patch("sys.argv", ["killercoda-cli", "--version"])
-    @mock.patch("builtins.print")
-    def test_version_flag(self, mock_print):
-        cli.main()
-        mock_print.assert_called_with(f"killercoda-cli v{cli.__about__.__version__}")
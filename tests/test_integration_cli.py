@@ -1,28 +1,83 @@
+import builtins
 import unittest
 import json
-from unittest.mock import patch
-from io import StringIO
 import os
 import shutil
+import sys
+import tempfile
 
 # Assuming cli.py is structured as a module you can import from
 from killercoda_cli import cli
 
+# Suffix scratch directories with the xdist worker id so parallel workers don't collide
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+# The scaffold index.json is constant, serialize it once at import
+_INDEX_JSON_BYTES = json.dumps(
+    {"details": {"steps": [{"title": "Step 1", "text": "step1/step1.md", "background": "step1/background.sh"}]}}
+).encode('ascii')
+
+
+def _write_bytes(path, data):
+    """Write a small fixture file with a single unbuffered write."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+class _FastOut:
+    """Minimal stdout replacement that collects writes and joins them once on read."""
+    __slots__ = ('parts',)
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, s):
+        self.parts.append(s)
+        return len(s)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "".join(self.parts)
+
+
 class TestCLIIntegration(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Build the scenario scaffold once, on tmpfs when available
+        cls._template = tempfile.mkdtemp(dir='/dev/shm' if os.path.isdir('/dev/shm') else None)
+        os.makedirs(os.path.join(cls._template, 'step1'))
+        _write_bytes(os.path.join(cls._template, 'step1/step1.md'), b"# Step 1\n")
+        _write_bytes(os.path.join(cls._template, 'index.json'), _INDEX_JSON_BYTES)
+
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._template, ignore_errors=True)
+
     def setUp(self):
-        # Setup test environment, e.g., creating a temporary directory structure
-        self.test_dir = '/tmp/test_cli_integration'
-        os.makedirs(self.test_dir, exist_ok=True)
-        # Create necessary files and directories for testing
-        os.makedirs(os.path.join(self.test_dir, 'step1'), exist_ok=True)
-        with open(os.path.join(self.test_dir, 'step1/step1.md'), 'w') as f:
-            f.write("# Step 1\n")
-        with open(os.path.join(self.test_dir, 'index.json'), 'w') as f:
-            json.dump({"details": {"steps": [{"title": "Step 1", "text": "step1/step1.md", "background": "step1/background.sh"}]}}, f)
+        # Setup test environment by copying the prebuilt scaffold
+        self.test_dir = f'/tmp/test_cli_integration_{_WORKER}'
+        shutil.copytree(self._template, self.test_dir, dirs_exist_ok=True)
+        # Capture stdout and pin argv with plain assignments instead of mock.patch
+        self.stdout = _FastOut()
+        self.addCleanup(setattr, sys, 'stdout', sys.stdout)
+        sys.stdout = self.stdout
+        self.addCleanup(setattr, sys, 'argv', sys.argv)
+        sys.argv = ['killercoda-cli']
+
+    def _feed_input(self, answers):
+        # Answer successive input() prompts from the given list
+        answers = iter(answers)
+        self.addCleanup(setattr, builtins, 'input', builtins.input)
+        builtins.input = lambda prompt='': next(answers)
 
     def test_generate_assets(self):
         # Setup test environment
-        test_generate_dir = '/tmp/test_generate_assets'
+        test_generate_dir = f'/tmp/test_generate_assets_{_WORKER}'
         os.makedirs(test_generate_dir, exist_ok=True)
         os.chdir(test_generate_dir)
         
@@ -38,17 +93,15 @@ class TestCLIIntegration(unittest.TestCase):
         # Clean up the test directory
         shutil.rmtree(test_generate_dir)
 
-    @patch('sys.argv', ['killercoda-cli', '--help'])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cli_main_help_message(self, mock_stdout):
+    def test_cli_main_help_message(self):
+        sys.argv = ['killercoda-cli', '--help']
         cli.main()
-        output = mock_stdout.getvalue()
+        output = self.stdout.getvalue()
         self.assertIn("Usage: killercoda-cli [OPTIONS]", output)
         self.assertIn("A CLI helper for writing KillerCoda scenarios", output)
 
-    @patch('builtins.input', side_effect=["title for new step", "2"])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cli_main_integration(self, mock_stdout, mock_input):
+    def test_cli_main_integration(self):
+        self._feed_input(["title for new step", "2"])
         # Change the current working directory to the test directory
         os.chdir(self.test_dir)
 
@@ -59,21 +112,15 @@ class TestCLIIntegration(unittest.TestCase):
         
         # Check if the CLI tool ran successfully by inspecting stdout or other side effects
         # Adjusted the expected output to match the actual CLI behavior
-        self.assertIn("An error occurred:", mock_stdout.getvalue())
+        self.assertIn("An error occurred:", self.stdout.getvalue())
 
     def tearDown(self):
         # Clean up the test directory after the test is complete
-        os.chdir(self.test_dir)  # Return to the original directory
-        os.chdir('/tmp')  # Return to the original directory
-        for root, dirs, files in os.walk(self.test_dir, topdown=False):
-            for name in files:
-                os.remove(os.path.join(root, name))
-            for name in dirs:
-                os.rmdir(os.path.join(root, name))
-
-    @patch('builtins.input', side_effect=["New Step Title", "0", "2"])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cli_main_invalid_step_number(self, mock_stdout, mock_input):
+        os.chdir('/tmp')  # Leave the test directory before removing it
+        shutil.rmtree(self.test_dir, ignore_errors=True)
+
+    def test_cli_main_invalid_step_number(self):
+        self._feed_input(["New Step Title", "0", "2"])
         # Change the current working directory to the test directory
         os.chdir(self.test_dir)
 
@@ -82,11 +129,10 @@ class TestCLIIntegration(unittest.TestCase):
 
 
         # Check if the CLI tool printed the correct error message for invalid step number
-        self.assertIn("Please enter a valid step number between 1 and 2.", mock_stdout.getvalue())
+        self.assertIn("Please enter a valid step number between 1 and 2.", self.stdout.getvalue())
 
-    @patch('builtins.input', side_effect=["New Step Title", "not a number", "2"])
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cli_main_non_numeric_step_number(self, mock_stdout, mock_input):
+    def test_cli_main_non_numeric_step_number(self):
+        self._feed_input(["New Step Title", "not a number", "2"])
         # Change the current working directory to the test directory
         os.chdir(self.test_dir)
         try:
@@ -96,21 +142,14 @@ class TestCLIIntegration(unittest.TestCase):
             # Check if the CLI tool printed the correct error message for non-numeric input
             self.assertIn("That's not a valid number. Please try again.", str(e))
 
-    @patch('sys.stdout', new_callable=StringIO)
-    def test_cli_main_no_step_files(self, mock_stdout):
+    def test_cli_main_no_step_files(self):
         # Change the current working directory to an empty test directory
-        empty_test_dir = '/tmp/test_cli_no_steps'
+        empty_test_dir = f'/tmp/test_cli_no_steps_{_WORKER}'
         os.makedirs(empty_test_dir, exist_ok=True)
+        self.addCleanup(os.rmdir, empty_test_dir)
         os.chdir(empty_test_dir)
-        try:
-            cli.main()
-        except SystemExit as e:
-            self.assertEqual(e.code, 1)
-            self.assertIn("The 'index.json' file is missing. Please ensure it is present in the current directory.", mock_stdout.getvalue())
-            self.assertIn("No step files or directories found.", mock_stdout.getvalue())
-
-        # Clean up the empty test directory
-        os.rmdir(empty_test_dir)
+        cli.main()
+        self.assertIn("The 'index.json' file is missing. Please ensure it is present in the current directory.", self.stdout.getvalue())
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,109 +1,85 @@
+import contextlib
+import io
 import unittest
 from unittest import mock
 from unittest.mock import patch
 from killercoda_cli import scenario_init
 
-class TestScenarioInit(unittest.TestCase):
+# Answers to the init prompts, in the order init_project asks them
+_DEFAULT_ANSWERS = (
+    {'value': 'Project Title'},
+    {'value': 'Project Description'},
+    {'choice': 'beginner'},
+    {'choice': '15 minutes'},
+    {'choice': 'kubernetes-kubeadm-1node'},
+    {'confirm': True}
+)
+
+_EXPECTED_INDEX = {
+    "title": "Project Title",
+    "description": "Project Description",
+    "difficulty": "beginner",
+    "time": "15 minutes",
+    "details": {
+        "intro": {"text": "intro.md"},
+        "finish": {"text": "finish.md"},
+        "steps": [],
+        "assets": {"host01": []}
+    },
+    "backend": {"imageid": "kubernetes-kubeadm-1node"},
+    "interface": {"layout": "ide"}
+}
+
+_MARKDOWN_FILES = {"intro.md": "# Introduction\n", "finish.md": "# Finish\n"}
 
-    @patch("inquirer.prompt")
-    @patch("os.path.exists", return_value=False)
-    @patch("builtins.open", new_callable=mock.mock_open)
-    @patch("json.dump")
-    def test_init_project(self, mock_json_dump, mock_open, mock_exists, mock_prompt):
-        mock_prompt.side_effect = [
-            {'value': 'Project Title'},
-            {'value': 'Project Description'},
-            {'choice': 'beginner'},
-            {'choice': '15 minutes'},
-            {'choice': 'kubernetes-kubeadm-1node'},
-            {'confirm': True}
-        ]
-        
-        scenario_init.init_project()
+# One mock_open graph for the whole module, reset before each test
+_SHARED_MO = mock.mock_open()
+
+class TestScenarioInit(unittest.TestCase):
 
-        expected_data = {
-            "title": "Project Title",
-            "description": "Project Description",
-            "difficulty": "beginner",
-            "time": "15 minutes",
-            "details": {
-                "intro": {"text": "intro.md"},
-                "finish": {"text": "finish.md"},
-                "steps": [],
-                "assets": {"host01": []}
-            },
-            "backend": {"imageid": "kubernetes-kubeadm-1node"},
-            "interface": {"layout": "ide"}
-        }
+    def _patch(self, *args, **kwargs):
+        patcher = patch(*args, **kwargs)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
 
-        # Check that the index.json file was created with the expected data
-        calls = [
-            mock.call("index.json", "w"),
-            mock.call("intro.md", "w"),
-            mock.call("finish.md", "w")
-        ]
-        mock_open.assert_has_calls(calls, any_order=True)
-        mock_json_dump.assert_called_once_with(expected_data, mock.ANY, ensure_ascii=False, indent=4)
+    def setUp(self):
+        self.mock_prompt = self._patch("inquirer.prompt", side_effect=iter(_DEFAULT_ANSWERS))
+        self.mock_exists = self._patch("os.path.exists", return_value=False)
+        _SHARED_MO.reset_mock()
+        self.mock_open = self._patch("builtins.open", new=_SHARED_MO)
+        self.mock_json_dump = self._patch("json.dump")
 
-    @patch("os.path.exists", return_value=True)
-    @patch("builtins.print")
-    def test_init_project_existing_index(self, mock_print, mock_exists):
-        scenario_init.init_project()
-        mock_print.assert_called_once_with("The 'index.json' file already exists. Please edit the existing file.")
+    def test_init_project(self):
+        # (os.path.exists predicate, markdown files init_project should create)
+        cases = (
+            (lambda path: False, ("intro.md", "finish.md")),
+            (lambda path: path == "intro.md", ("finish.md",)),
+            (lambda path: path == "finish.md", ("intro.md",)),
+        )
+        for exists, created in cases:
+            with self.subTest(created=created):
+                self.mock_prompt.side_effect = iter(_DEFAULT_ANSWERS)
+                self.mock_exists.side_effect = exists
+                self.mock_open.reset_mock()
+                self.mock_json_dump.reset_mock()
 
-    @patch("os.path.exists", side_effect=lambda path: path == "intro.md")
-    @patch("builtins.open", new_callable=mock.mock_open)
-    @patch("inquirer.prompt")
-    def test_init_project_create_finish_md(self, mock_prompt, mock_open, mock_exists):
-        mock_prompt.side_effect = [
-            {'value': 'Project Title'},
-            {'value': 'Project Description'},
-            {'choice': 'beginner'},
-            {'choice': '15 minutes'},
-            {'choice': 'kubernetes-kubeadm-1node'},
-            {'confirm': True}
-        ]
-        
-        scenario_init.init_project()
-        mock_open.assert_any_call("finish.md", "w")
-        mock_open().write.assert_any_call("# Finish\n")
+                scenario_init.init_project()
 
-    @patch("os.path.exists", side_effect=lambda path: path == "finish.md")
-    @patch("builtins.open", new_callable=mock.mock_open)
-    @patch("inquirer.prompt")
-    def test_init_project_create_intro_md(self, mock_prompt, mock_open, mock_exists):
-        mock_prompt.side_effect = [
-            {'value': 'Project Title'},
-            {'value': 'Project Description'},
-            {'choice': 'beginner'},
-            {'choice': '15 minutes'},
-            {'choice': 'kubernetes-kubeadm-1node'},
-            {'confirm': True}
-        ]
-        
-        scenario_init.init_project()
-        mock_open.assert_any_call("intro.md", "w")
-        mock_open().write.assert_any_call("# Introduction\n")
+                self.mock_open.assert_any_call("index.json", "w")
+                self.mock_json_dump.assert_called_once_with(_EXPECTED_INDEX, mock.ANY, ensure_ascii=False, indent=4)
+                for name, content in _MARKDOWN_FILES.items():
+                    if name in created:
+                        self.mock_open.assert_any_call(name, "w")
+                        self.mock_open().write.assert_any_call(content)
+                    else:
+                        self.assertNotIn(mock.call(name, "w"), self.mock_open.call_args_list)
 
-    @patch("os.path.exists", return_value=False)
-    @patch("builtins.open", new_callable=mock.mock_open)
-    @patch("json.dump")
-    @patch("inquirer.prompt")
-    def test_init_project_files_created(self, mock_prompt, mock_json_dump, mock_open, mock_exists):
-        mock_prompt.side_effect = [
-            {'value': 'Project Title'},
-            {'value': 'Project Description'},
-            {'choice': 'beginner'},
-            {'choice': '15 minutes'},
-            {'choice': 'kubernetes-kubeadm-1node'},
-            {'confirm': True}
-        ]
-        
-        scenario_init.init_project()
-        mock_open.assert_any_call("intro.md", "w")
-        mock_open().write.assert_any_call("# Introduction\n")
-        mock_open.assert_any_call("finish.md", "w")
-        mock_open().write.assert_any_call("# Finish\n")
+    def test_init_project_existing_index(self):
+        self.mock_exists.return_value = True
+        buf = io.StringIO()
+        with contextlib.redirect_stdout(buf):
+            scenario_init.init_project()
+        self.assertEqual(buf.getvalue(), "The 'index.json' file already exists. Please edit the existing file.\n")
 
 if __name__ == "__main__":
     unittest.main()